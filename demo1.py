@@ -1,121 +1,348 @@
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import joblib
 import numpy as np
 import pandas as pd
-from faker import Faker
 from sklearn.model_selection import train_test_split
 from sklearn.preprocessing import StandardScaler
 from sklearn.svm import SVC
 from sklearn.metrics import accuracy_score, confusion_matrix, classification_report
-import matplotlib.pyplot as plt
-import seaborn as sns
 
-# Sahte veri üreteci oluştur
-fake = Faker()
+# Modelin beklediği özellik sütunları (sıra önemli)
+FEATURES = ['tecrube_yili', 'teknik_puan']
+
+# Eğitilmiş model ve ölçekleyicinin kaydedildiği varsayılan dosya
+MODEL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'demo1_model.joblib')
 
 # Başvuru verilerini üreten fonksiyon
-def generate_recruitment_data(num_samples=200):
+def generate_recruitment_data(num_samples=200, seed=None):
+    from faker import Faker
+
+    # Sahte veri üreteci oluştur (seed verilirse aynı veri tekrar üretilir)
+    fake = Faker()
+    if seed is not None:
+        fake.seed_instance(seed)
     data = []
     for _ in range(num_samples):
         # Rastgele tecrübe yılı (0-10 arası)
         tecrube_yili = fake.random.uniform(0, 10)
         # Rastgele teknik sınav puanı (0-100 arası)
         teknik_puan = fake.random.uniform(0, 100)
-        
+
         # İşe alım kriteri:
         # Tecrübesi 2 yıldan az VE sınav puanı 60'tan düşük olanlar işe alınmıyor
         if tecrube_yili < 2 and teknik_puan < 60:
             etiket = 1  # İşe alınmadı
         else:
             etiket = 0  # İşe alındı
-            
+
         data.append({
             'tecrube_yili': tecrube_yili,
             'teknik_puan': teknik_puan,
             'etiket': etiket
         })
-    
+
     return pd.DataFrame(data)
 
-# 200 adet başvuru verisi üret
-df = generate_recruitment_data(200)
+# Modeli eğiten ve test seti üzerinde değerlendiren fonksiyon
+def train_model(df, verbose=True):
+    # Özellikler ve hedef değişkeni ayır
+    X = df[FEATURES].to_numpy(dtype=float)
+    y = df['etiket'].to_numpy()
+
+    # Veriyi eğitim ve test setlerine ayır (%80 eğitim, %20 test)
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+
+    # Veriyi ölçeklendir (StandardScaler ile)
+    scaler = StandardScaler()
+    X_train_scaled = scaler.fit_transform(X_train)
+    X_test_scaled = scaler.transform(X_test)
+
+    # SVM modelini oluştur ve eğit
+    model = SVC(kernel='linear')
+    model.fit(X_train_scaled, y_train)
+
+    # Test seti üzerinde tahmin yap
+    y_pred = model.predict(X_test_scaled)
+
+    # Model performansını değerlendir
+    if verbose:
+        print("Doğruluk Skoru:", accuracy_score(y_test, y_pred))
+        print("\nKarışıklık Matrisi:")
+        print(confusion_matrix(y_test, y_pred))
+        print("\nSınıflandırma Raporu:")
+        print(classification_report(y_test, y_pred))
+
+    return model, scaler, X_train_scaled, y_train
+
+# Model ve ölçekleyiciyi tek dosyaya kaydeden fonksiyon
+def save_model(model, scaler, path=MODEL_PATH):
+    joblib.dump({'model': model, 'scaler': scaler, 'features': FEATURES}, path)
+
+# Kaydedilmiş model ve ölçekleyiciyi yükleyen fonksiyon
+def load_model(path=MODEL_PATH):
+    bundle = joblib.load(path)
+    if not isinstance(bundle, dict):
+        raise ValueError(f"Model dosyası beklenmeyen biçimde: {type(bundle).__name__}")
+    if bundle.get('features') != FEATURES:
+        raise ValueError(f"Model dosyası beklenmeyen özellikler içeriyor: {bundle.get('features')}")
+    return bundle['model'], bundle['scaler']
+
+
+class CandidateScorer:
+    """Kaydedilmiş SVM modeliyle adayları toplu olarak puanlar.
+
+    Puanlar ``decision_function`` değerleridir; pozitif değerler
+    ``model.classes_[1]`` (İşe Alınmadı) sınıfına karşılık gelir.
+    """
+
+    def __init__(self, model, scaler):
+        self.model = model
+        self.scaler = scaler
+
+    @classmethod
+    def from_file(cls, path=MODEL_PATH):
+        model, scaler = load_model(path)
+        return cls(model, scaler)
+
+    def _as_array(self, candidates):
+        # DataFrame ise sütunları doğru sırada al, değilse (n, 2) dizisine çevir
+        if isinstance(candidates, pd.DataFrame):
+            candidates = candidates[FEATURES].to_numpy(dtype=float)
+        X = np.asarray(candidates, dtype=float)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+        if X.ndim != 2 or X.shape[1] != len(FEATURES):
+            raise ValueError(f"Adaylar (n, {len(FEATURES)}) boyutunda olmalı, gelen: {X.shape}")
+        return X
+
+    def score(self, candidates):
+        # Tüm aday grubu tek bir ölçekleme ve tek bir decision_function çağrısıyla puanlanır
+        X = self._as_array(candidates)
+        if X.shape[0] == 0:
+            return np.empty(0)
+        return self.model.decision_function(self.scaler.transform(X))
+
+    def _label(self, scores):
+        # İkili SVC'de predict, decision_function > 0 ile aynı kararı verir
+        return np.where(scores > 0, self.model.classes_[1], self.model.classes_[0])
+
+    def predict(self, candidates):
+        return self._label(self.score(candidates))
+
+    def score_frame(self, df):
+        scores = self.score(df)
+        result = df.copy()
+        result['skor'] = scores
+        result['tahmin'] = self._label(scores)
+        return result
 
-# Özellikler ve hedef değişkeni ayır
-X = df[['tecrube_yili', 'teknik_puan']]
-y = df['etiket']
+    def _check_chunk(self, chunk):
+        # Eksik sütun, boş ya da sayısal olmayan değer puanlamadan önce yakalanır
+        missing = [col for col in FEATURES if col not in chunk.columns]
+        if missing:
+            raise ValueError(f"CSV dosyasında eksik sütunlar: {missing}")
+        values = chunk[FEATURES].apply(pd.to_numeric, errors='coerce')
+        bad = values.isna().any(axis=1)
+        if bad.any():
+            rows = chunk.index[bad]
+            raise ValueError(
+                f"{chunk.index[0]}-{chunk.index[-1]} satır aralığındaki parçada geçersiz değer var "
+                f"(ilk hatalı satır: {rows[0]}, toplam {len(rows)} satır)"
+            )
 
-# Veriyi eğitim ve test setlerine ayır (%80 eğitim, %20 test)
-X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+    def score_csv(self, path, chunksize=100_000):
+        # Bellekten büyük dosyalar için CSV parça parça okunur ve puanlanır
+        for chunk in pd.read_csv(path, chunksize=chunksize):
+            self._check_chunk(chunk)
+            yield self.score_frame(chunk)
 
-# Veriyi ölçeklendir (StandardScaler ile)
-scaler = StandardScaler()
-X_train_scaled = scaler.fit_transform(X_train)
-X_test_scaled = scaler.transform(X_test)
+    def score_csv_to_file(self, input_path, output_path, chunksize=100_000):
+        # Sonuçlar parça parça geçici bir dosyaya yazılır; bellekte hiçbir zaman tüm dosya
+        # tutulmaz. Hata olursa geçici dosya silinir, böylece yarım kalmış bir çıktı
+        # tamamlanmış gibi görünmez.
+        tmp_path = f"{output_path}.tmp"
+        total = 0
+        try:
+            for i, scored in enumerate(self.score_csv(input_path, chunksize=chunksize)):
+                # Başlık ilk puanlanmış parçadan alınır; girdide skor/tahmin varsa üzerine yazılır
+                scored.to_csv(tmp_path, mode='w' if i == 0 else 'a', header=(i == 0), index=False)
+                total += len(scored)
+            if total == 0:
+                # Yalnızca başlık içeren girdi: çıktıya da yalnızca başlık yazılır
+                columns = list(pd.read_csv(input_path, nrows=0).columns)
+                columns += [col for col in ('skor', 'tahmin') if col not in columns]
+                pd.DataFrame(columns=columns).to_csv(tmp_path, index=False)
+            os.replace(tmp_path, output_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return total
 
-# SVM modelini oluştur ve eğit
-model = SVC(kernel='linear')
-model.fit(X_train_scaled, y_train)
 
-# Test seti üzerinde tahmin yap
-y_pred = model.predict(X_test_scaled)
+# Tekli ve toplu puanlama yollarının hızını (aday/saniye) ölçen fonksiyon
+def benchmark_scorer(scorer, n_single=1_000, n_batch=100_000, seed=0):
+    rng = np.random.default_rng(seed)
+    n_rows = max(n_single, n_batch)
+    candidates = np.column_stack([
+        rng.uniform(0, 10, n_rows),
+        rng.uniform(0, 100, n_rows),
+    ])
 
-# Model performansını değerlendir
-print("Doğruluk Skoru:", accuracy_score(y_test, y_pred))
-print("\nKarışıklık Matrisi:")
-print(confusion_matrix(y_test, y_pred))
-print("\nSınıflandırma Raporu:")
-print(classification_report(y_test, y_pred))
+    start = time.perf_counter()
+    for row in candidates[:n_single]:
+        scorer.score(row)
+    single_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    scorer.score(candidates[:n_batch])
+    batch_elapsed = time.perf_counter() - start
+
+    results = {
+        'tekli': n_single / single_elapsed,
+        'toplu': n_batch / batch_elapsed,
+    }
+    print(f"Tekli puanlama: {results['tekli']:,.0f} aday/sn ({n_single} aday)")
+    print(f"Toplu puanlama: {results['toplu']:,.0f} aday/sn ({n_batch} aday)")
+    return results
+
+# Toplu puanlamanın eski tekli yol ve parça parça CSV çıktısıyla aynı sonucu verdiğini doğrulayan fonksiyon
+def verify_scorer(seed=42, num_samples=500, chunksize=37):
+    from pandas.testing import assert_frame_equal
+
+    df = generate_recruitment_data(num_samples, seed=seed)
+    model, scaler, _, _ = train_model(df, verbose=False)
+    scorer = CandidateScorer(model, scaler)
+
+    # 1) Toplu tahmin, eski satır satır model.predict(scaler.transform(...)) ile aynı olmalı
+    X = df[FEATURES].to_numpy(dtype=float)
+    per_row = np.array([model.predict(scaler.transform([row]))[0] for row in X])
+    batch = scorer.predict(X)
+    if not np.array_equal(per_row, batch):
+        raise AssertionError(f"Toplu ve tekli tahminler {np.sum(per_row != batch)} satırda farklı")
+
+    # 2) Parça parça yazılan CSV, tek seferde score_frame çıktısıyla aynı olmalı
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        input_path = os.path.join(tmp_dir, 'adaylar.csv')
+        output_path = os.path.join(tmp_dir, 'sonuclar.csv')
+        df[FEATURES].to_csv(input_path, index=False)
+        expected = scorer.score_frame(pd.read_csv(input_path))
+        total = scorer.score_csv_to_file(input_path, output_path, chunksize=chunksize)
+        chunked = pd.read_csv(output_path)
+    if total != len(expected):
+        raise AssertionError(f"{len(expected)} aday bekleniyordu, {total} aday puanlandı")
+    assert_frame_equal(chunked, expected, check_dtype=False)
+
+    print(f"Doğrulama başarılı: {num_samples} aday, parça boyutu {chunksize}")
 
 # Karar sınırını görselleştiren fonksiyon
-def plot_decision_boundary():
+def plot_decision_boundary(model, X_train_scaled, y_train):
+    import matplotlib.pyplot as plt
+
     plt.figure(figsize=(10, 6))
-    
+
     # Eğitim verilerini çiz
-    plt.scatter(X_train_scaled[y_train == 0][:, 0], X_train_scaled[y_train == 0][:, 1], 
+    plt.scatter(X_train_scaled[y_train == 0][:, 0], X_train_scaled[y_train == 0][:, 1],
                 color='blue', label='İşe Alındı')
-    plt.scatter(X_train_scaled[y_train == 1][:, 0], X_train_scaled[y_train == 1][:, 1], 
+    plt.scatter(X_train_scaled[y_train == 1][:, 0], X_train_scaled[y_train == 1][:, 1],
                 color='red', label='İşe Alınmadı')
-    
+
     # Karar sınırını çiz
     ax = plt.gca()
     xlim = ax.get_xlim()
     ylim = ax.get_ylim()
-    
+
     # Karar sınırı için ızgara oluştur
     xx = np.linspace(xlim[0], xlim[1], 30)
     yy = np.linspace(ylim[0], ylim[1], 30)
     YY, XX = np.meshgrid(yy, xx)
     xy = np.vstack([XX.ravel(), YY.ravel()]).T
     Z = model.decision_function(xy).reshape(XX.shape)
-    
+
     # Karar sınırını ve marjini çiz
-    ax.contour(XX, YY, Z, colors='k', levels=[-1, 0, 1], 
+    ax.contour(XX, YY, Z, colors='k', levels=[-1, 0, 1],
                alpha=0.5, linestyles=['--', '-', '--'])
-    
+
     plt.xlabel('Tecrübe Yılı (Ölçeklendirilmiş)')
     plt.ylabel('Teknik Puan (Ölçeklendirilmiş)')
     plt.title('SVM Karar Sınırı')
     plt.legend()
     plt.show()
 
-# Görselleştirmeyi göster
-plot_decision_boundary()
-
 # Kullanıcıdan girdi alarak tahmin yapan fonksiyon
-def predict_candidate():
+def predict_candidate(scorer):
     print("\nAday Değerlendirme Sistemi")
     print("-------------------------")
     tecrube = float(input("Adayın tecrübe yılını girin (0-10): "))
     puan = float(input("Adayın teknik sınav puanını girin (0-100): "))
-    
-    # Girdiyi ölçeklendir
-    input_data = scaler.transform([[tecrube, puan]])
-    
-    # Tahmin yap
-    prediction = model.predict(input_data)[0]
-    
+
+    # Tahmin yap (ölçekleme puanlayıcı içinde yapılır)
+    prediction = scorer.predict([[tecrube, puan]])[0]
+
     if prediction == 0:
         print("\nSonuç: Aday İŞE ALINDI!")
     else:
         print("\nSonuç: Aday İŞE ALINMADI!")
 
-# Tahmin fonksiyonunu çağır
-predict_candidate() 
\ No newline at end of file
+
+def main():
+    parser = argparse.ArgumentParser(description='SVM ile aday değerlendirme')
+    parser.add_argument('--model', default=MODEL_PATH, help='Model dosyasının yolu')
+    parser.add_argument('--train', action='store_true', help='Modeli yeniden eğit ve kaydet')
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--score', metavar='CSV', help='Puanlanacak aday CSV dosyası')
+    mode.add_argument('--benchmark', action='store_true', help='Tekli/toplu puanlama hızını ölç')
+    mode.add_argument('--verify', action='store_true',
+                      help='Toplu puanlamayı tekli yol ve parça parça CSV çıktısıyla karşılaştır')
+    parser.add_argument('--output', metavar='CSV', help='Puanlama sonuçlarının yazılacağı dosya')
+    parser.add_argument('--chunksize', type=int, default=100_000, help='CSV okuma parça boyutu')
+    parser.add_argument('--plot', action='store_true', help='Eğitimden sonra karar sınırını göster')
+    args = parser.parse_args()
+
+    if args.plot and not args.train:
+        parser.error('--plot için --train de verilmeli')
+    if args.chunksize < 1:
+        parser.error('--chunksize en az 1 olmalı')
+    if args.verify and args.train:
+        parser.error('--verify kendi modelini eğitir, --train ile birlikte kullanılamaz')
+    if args.verify:
+        # Doğrulama kendi modelini bellekte eğitir, kayıtlı model dosyasına ihtiyaç duymaz
+        verify_scorer()
+        return
+    if not args.train and not os.path.exists(args.model):
+        parser.error(f'Model dosyası bulunamadı: {args.model}. Önce --train ile modeli eğitin.')
+
+    if args.train:
+        # 200 adet başvuru verisi üret ve modeli eğit
+        df = generate_recruitment_data(200)
+        model, scaler, X_train_scaled, y_train = train_model(df)
+        save_model(model, scaler, args.model)
+        print(f"\nModel kaydedildi: {args.model}")
+        if args.plot:
+            plot_decision_boundary(model, X_train_scaled, y_train)
+
+    scorer = CandidateScorer.from_file(args.model)
+
+    if args.score:
+        try:
+            if args.output:
+                total = scorer.score_csv_to_file(args.score, args.output, chunksize=args.chunksize)
+                print(f"{total} aday puanlandı: {args.output}")
+            else:
+                for i, scored in enumerate(scorer.score_csv(args.score, chunksize=args.chunksize)):
+                    print(scored.to_csv(index=False, header=(i == 0)), end='')
+        except ValueError as e:
+            sys.exit(f"Hata: {e}")
+    elif args.benchmark:
+        benchmark_scorer(scorer)
+    elif not args.train:
+        predict_candidate(scorer)
+
+
+if __name__ == '__main__':
+    main()